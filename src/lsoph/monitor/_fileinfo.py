@@ -6,6 +6,7 @@ Path is stored as bytes.
 
 import time
 from collections import deque
+from collections.abc import Iterator
 from dataclasses import dataclass, field
 from typing import Any
 
@@ -46,3 +47,16 @@ class FileInfo:
     def is_open(self) -> bool:
         """Checks if any process currently holds this file open according to state."""
         return bool(self.open_by_pids)
+
+    @property
+    def event_count(self) -> int:
+        """Number of events currently held in the history."""
+        return len(self.event_history)
+
+    def iter_events(self) -> Iterator[dict[str, Any]]:
+        """
+        Iterates over the event history, oldest first.
+        Iterates a snapshot of the deque, so it's safe to consume from another
+        thread while the monitor keeps appending.
+        """
+        return iter(tuple(self.event_history))
@@ -1,29 +1,149 @@
 # Filename: src/lsoph/ui/detail_screen.py
 """Screen to display file event history using a DataTable. Handles bytes path."""
 
-import datetime
+import functools
 import logging
+import math
 import os  # For os.fsdecode
+import time
+from collections.abc import Iterator
+from itertools import islice
 from typing import Any
 
+from rich.control import strip_control_codes
 from rich.text import Text
+from textual import work
 from textual.app import ComposeResult
 from textual.binding import Binding
 from textual.containers import Vertical
 from textual.screen import Screen
 from textual.widgets import DataTable, Footer, Static
+from textual.widgets.data_table import RowKey
+from textual.worker import get_current_worker
 
 from lsoph.monitor import FileInfo  # FileInfo.path is bytes
-
-# short_path accepts bytes, returns str
 from lsoph.util.short_path import short_path
+from lsoph.util.string import short_string
 
 # Import the emoji map from the emoji module
-from .emoji import DEFAULT_EMOJI, EVENT_EMOJI_MAP, STATUS_EMOJI_MAP
+from .emoji import DEFAULT_EMOJI, EVENT_EMOJI_MAP
 
 log = logging.getLogger("lsoph.ui.detail")
 
 
+# Detail keys not shown in the generic details column
+EXCLUDED_DETAIL_KEYS = frozenset({"syscall", "type", "success", "ts", "error_msg"})
+
+# Emoji shown for any failed event, whatever its type
+ERROR_EMOJI = EVENT_EMOJI_MAP.get("ERROR", DEFAULT_EMOJI)
+
+# Result cells; DataTable only reads them, so every row shares these
+OK_TEXT = Text("OK", style="green")
+FAIL_TEXT = Text("FAIL", style="red")
+
+# Type alias for the visual data tuple of one history row
+EventRow = tuple[Text, Text, Text, Text]
+
+
+# --- Formatting Helpers ---
+# Largest timestamp shown as a wall-clock time (year 2286), checked instead of try/except
+MAX_CLOCK_TS = 9_999_999_999
+# Bound once so the per-row code skips the module attribute lookups
+_localtime = time.localtime
+_emoji_get = EVENT_EMOJI_MAP.get
+_fsdecode = os.fsdecode
+
+
+@functools.lru_cache(maxsize=256)
+def _fmt_second(second: int) -> str:
+    """Formats a whole epoch second as local HH:MM:SS. Cached, events come in bursts."""
+    lt = _localtime(second)
+    return f"{lt.tm_hour:02d}:{lt.tm_min:02d}:{lt.tm_sec:02d}"
+
+
+def _fmt_ts(ts: float) -> str:
+    """Formats an epoch timestamp as local HH:MM:SS.mmm without building a datetime."""
+    # Round the fraction to microseconds half-even, like datetime.fromtimestamp,
+    # then truncate to ms
+    frac, whole = math.modf(ts)
+    second = int(whole)
+    micros = round(frac * 1_000_000)
+    if micros == 1_000_000:
+        second += 1
+        micros = 0
+    return f"{_fmt_second(second)}.{micros // 1000:03d}"
+
+
+def _fmt_val(v: Any) -> str:
+    """Formats a detail value; only strings need repr's quoting."""
+    if isinstance(v, (str, bytes)):
+        return repr(v)
+    if isinstance(v, Text):
+        # Use plain representation for consistent formatting
+        return repr(v.plain)
+    return str(v)
+
+
+@functools.lru_cache(maxsize=64)
+def _event_cell(event_type: str, success: bool) -> Text:
+    """Builds the unstyled Event cell. DataTable never mutates cells, so it's shared."""
+    # Upper-casing happens here, once per distinct event type
+    event_type_str = event_type.upper()
+    emoji = _emoji_get(event_type_str, DEFAULT_EMOJI) if success else ERROR_EMOJI
+    return Text(f"{emoji} {event_type_str}")
+
+
+def _format_event_row(event: dict[str, Any]) -> EventRow:
+    """Formats a single event history entry into Text suitable for DataTable."""
+    # Format timestamp
+    ts_raw = event.get("ts")  # None when missing, which shows as "?"
+    ts_type = type(ts_raw)
+    if (ts_type is float or ts_type is int) and 0 < ts_raw < MAX_CLOCK_TS:
+        ts_str = _fmt_ts(ts_raw)
+    elif isinstance(ts_raw, (int, float)):
+        # Zero or outside what localtime can handle, show the raw number
+        ts_str = f"{ts_raw:.3f}"
+    else:
+        ts_str = "?"
+    ts_text = Text(ts_str)
+
+    # Get Event Type and Success
+    event_type = event.get("type", "?")
+    if type(event_type) is not str:
+        # Keeps the cache key hashable, whatever the event carries
+        event_type = str(event_type)
+    success = event.get("success", True)  # Default to True if missing
+
+    # Event Text with Emoji Prefix, shared between rows of the same kind
+    etype_text = _event_cell(event_type, success)
+
+    # Format result (OK/FAIL)
+    result_text = OK_TEXT if success else FAIL_TEXT
+
+    # Format details dictionary
+    details_dict: dict[str, Any] = event.get("details", {})
+    # Filter details, decoding bytes values (paths included) for display
+    filtered_details = {}
+    for k, v in details_dict.items():
+        if k in EXCLUDED_DETAIL_KEYS:
+            continue
+        filtered_details[k] = _fsdecode(v) if isinstance(v, bytes) else v
+
+    error_name = details_dict.get("error_name")
+    if error_name and not success:
+        filtered_details["ERROR"] = Text(error_name, style="red")
+
+    details_str = ", ".join([f"{k}={_fmt_val(v)}" for k, v in filtered_details.items()])
+    # Use a reasonable max width for shortening details text
+    details_display = short_string(details_str, 100)
+    details_text = Text(details_display)
+
+    return ts_text, etype_text, result_text, details_text
+
+
+# --- End Formatting Helpers ---
+
+
 class DetailScreen(Screen):
     """Screen to display event history and details for a specific file using DataTable."""
 
@@ -31,9 +151,15 @@ class DetailScreen(Screen):
         Binding("escape,q,d,enter", "app.pop_screen", "Close", show=True),
     ]
 
+    POPULATE_BATCH_SIZE = 200  # Rows handed to the table per UI-thread call
+
     def __init__(self, file_info: FileInfo):  # Receives FileInfo with bytes path
         self.file_info = file_info
+        self._loading_row_key: RowKey | None = None
         super().__init__()
+        # Decode and shorten the path once; it's used for the header and logging
+        self._path_str = os.fsdecode(file_info.path)
+        self._path_short = short_path(self._path_str, 100)
 
     def compose(self) -> ComposeResult:
         """Create child widgets for the detail screen."""
@@ -43,11 +169,8 @@ class DetailScreen(Screen):
         yield Footer()
 
     def _create_header_text(self) -> Text:
-        """Creates the header text displayed above the table (decodes path)."""
-        # --- DECODE AND SHORTEN PATH ---
-        # Use short_path utility which accepts bytes and returns decoded, shortened string
-        path_display_str = short_path(self.file_info.path, 100)
-        # -----------------------------
+        """Creates the header text displayed above the table."""
+        path_display_str = self._path_short
         status = self.file_info.status.upper()
         style = ""
         if self.file_info.status == "error":
@@ -57,17 +180,19 @@ class DetailScreen(Screen):
         elif self.file_info.status == "deleted":
             style = "strike"
 
-        header = Text.assemble(
-            "Details for: ", (path_display_str, "bold"), " | Status: ", (status, style)
-        )
+        # One Text styled by offset, rather than assembling it from parts.
+        # Text drops control codes, so strip them first to keep the offsets right
+        path_display_str = strip_control_codes(path_display_str)
+        prefix = "Details for: "
+        header = Text(f"{prefix}{path_display_str} | Status: {status}")
+        header.stylize("bold", len(prefix), len(prefix) + len(path_display_str))
+        header.stylize(style, len(header) - len(status))
         return header
 
     def on_mount(self) -> None:
-        """Called when the screen is mounted. Populates the DataTable."""
+        """Called when the screen is mounted. Starts populating the DataTable."""
         try:
             table = self.query_one(DataTable)
-            # Update the static header widget
-            self.query_one("#detail-header", Static).update(self._create_header_text())
 
             # Add columns to the DataTable
             table.add_column("Timestamp", key="ts", width=12)
@@ -78,121 +203,85 @@ class DetailScreen(Screen):
             # Let Details column be flexible - NO width specified
             table.add_column("Details", key="details")
 
-            history = self.file_info.event_history
+            event_count = self.file_info.event_count
             log.debug(
-                f"DetailScreen on_mount: Populating table with {len(history)} history events for {os.fsdecode(self.file_info.path)!r}."
+                f"DetailScreen on_mount: Populating table with {event_count} history events for {self._path_str!r}."
             )
 
-            if not history:
+            if not event_count:
                 table.add_row(
                     Text("No event history recorded for this file.", style="dim")
                 )
                 return
 
-            # Write each event from history as a row
-            for event in history:
-                # Format timestamp
-                ts_raw = event.get("ts", 0)
-                ts_str = f"{ts_raw:.3f}"
-                try:
-                    if isinstance(ts_raw, (int, float)) and ts_raw > 0:
-                        ts_str = datetime.datetime.fromtimestamp(ts_raw).strftime(
-                            "%H:%M:%S.%f"
-                        )[:-3]
-                except (TypeError, ValueError, OSError) as ts_err:
-                    log.warning(f"Could not format timestamp {ts_raw}: {ts_err}")
-                ts_text = Text(ts_str)
-
-                # Get Event Type and Success
-                event_type_str = str(event.get("type", "?")).upper()
-                success = event.get("success", True)  # Default to True if missing
-
-                # Determine Emoji
-                emoji = DEFAULT_EMOJI
-                if not success:
-                    emoji = EVENT_EMOJI_MAP.get("ERROR", DEFAULT_EMOJI)
-                else:
-                    emoji = EVENT_EMOJI_MAP.get(event_type_str, DEFAULT_EMOJI)
-
-                # Create Event Text with Emoji Prefix
-                etype_text = Text(f"{emoji} {event_type_str}")
-
-                # Format result (OK/FAIL)
-                result_text = (
-                    Text("OK", style="green") if success else Text("FAIL", style="red")
-                )
-
-                # Format details dictionary
-                details_dict: dict[str, Any] = event.get("details", {})
-                # Filter details, decode bytes paths if present for display
-                filtered_details = {}
-                for k, v in details_dict.items():
-                    if k not in [
-                        "syscall",
-                        "type",
-                        "success",
-                        "ts",
-                        "error_msg",
-                        # Exclude raw path details if they are bytes, handle below
-                        "target_path",
-                        "source_path",
-                        "renamed_to",
-                        "renamed_from",
-                    ]:
-                        # Decode other potential bytes values for display
-                        if isinstance(v, bytes):
-                            filtered_details[k] = os.fsdecode(v, "surrogateescape")
-                        else:
-                            filtered_details[k] = v
-
-                # Handle specific path details, decoding them
-                for path_key in [
-                    "target_path",
-                    "source_path",
-                    "renamed_to",
-                    "renamed_from",
-                ]:
-                    if path_key in details_dict and isinstance(
-                        details_dict[path_key], bytes
-                    ):
-                        # Add decoded path string to filtered details
-                        filtered_details[path_key] = os.fsdecode(
-                            details_dict[path_key], "surrogateescape"
-                        )
-
-                error_name = details_dict.get("error_name")
-                if error_name and not success:
-                    filtered_details["ERROR"] = Text(error_name, style="red")
-
-                details_parts = []
-                for k, v in filtered_details.items():
-                    if isinstance(v, Text):
-                        # Use plain representation for consistent formatting
-                        details_parts.append(f"{k}={v.plain!r}")
-                    else:
-                        details_parts.append(f"{k}={v!r}")
-
-                details_str = ", ".join(details_parts)
-                # Use a reasonable max width for shortening details text
-                details_display = short_path(
-                    details_str.encode("utf-8", "surrogateescape"), 100
-                )  # Encode back for short_path
-                details_text = Text(details_display)
-
-                # Add the row to the table
-                table.add_row(ts_text, etype_text, result_text, details_text)
-
-            # Focus the table after populating
+            # Show a placeholder until the worker delivers the first batch
+            self._loading_row_key = table.add_row(Text("Loading…", style="dim"))
             table.focus()
+            self._populate(self.file_info.iter_events())
 
         except Exception as e:
-            log.exception(
-                f"Error populating detail screen table for {os.fsdecode(self.file_info.path)!r}"
-            )
-            try:
-                table = self.query_one(DataTable)
-                table.clear()
-                table.add_row(Text(f"Error loading details: {e}", style="bold red"))
-            except Exception:
-                pass
-            self.notify("Error loading details.", severity="error")
+            self._show_error(e)
+
+    @work(exclusive=True, thread=True)
+    def _populate(self, events: Iterator[dict[str, Any]]) -> None:
+        """Formats history rows off the UI thread and posts them back in batches."""
+        worker = get_current_worker()
+        try:
+            shown = skipped = 0
+            # Stop early if the screen was dismissed, nobody is waiting for the rest
+            while not worker.is_cancelled:
+                chunk = list(islice(events, self.POPULATE_BATCH_SIZE))
+                if not chunk:
+                    break
+                batch = []
+                for event in chunk:
+                    # Zero-cost when nothing raises; one bad event shouldn't blank the table
+                    try:
+                        batch.append(_format_event_row(event))
+                    except Exception:
+                        skipped += 1
+                        log.debug("Skipping malformed history event", exc_info=True)
+                # Keep the placeholder until there's something to replace it with
+                if batch:
+                    shown += len(batch)
+                    self.app.call_from_thread(self._flush_rows, batch)
+            if not shown and not worker.is_cancelled:
+                self.app.call_from_thread(self._show_nothing_displayable, skipped)
+        except Exception as e:
+            if not worker.is_cancelled:
+                self.app.call_from_thread(self._show_error, e)
+
+    def _flush_rows(self, rows: list[EventRow]) -> None:
+        """Appends a batch of formatted rows, dropping the placeholder on first use."""
+        if not self.is_mounted:
+            return
+        table = self.query_one(DataTable)
+        if self._loading_row_key is not None:
+            table.remove_row(self._loading_row_key)
+            self._loading_row_key = None
+        table.add_rows(rows)
+
+    def _show_nothing_displayable(self, skipped: int) -> None:
+        """Replaces the placeholder when every event was skipped as malformed."""
+        if not self.is_mounted:
+            return
+        table = self.query_one(DataTable)
+        if self._loading_row_key is not None:
+            table.remove_row(self._loading_row_key)
+            self._loading_row_key = None
+        table.add_row(Text(f"No displayable events ({skipped} skipped).", style="dim"))
+
+    def _show_error(self, e: Exception) -> None:
+        """Replaces the table contents with an error row."""
+        log.exception(
+            f"Error populating detail screen table for {self._path_str!r}",
+            exc_info=e,
+        )
+        try:
+            table = self.query_one(DataTable)
+            table.clear()
+            self._loading_row_key = None
+            table.add_row(Text(f"Error loading details: {e}", style="bold red"))
+        except Exception:
+            pass
+        self.notify("Error loading details.", severity="error")
@@ -31,3 +31,35 @@ def c_str_to_bytes(s: str) -> bytes:
     # Then encode to bytes using latin-1 to preserve all byte values
     # latin-1 (ISO-8859-1) is a perfect 1:1 mapping between unicode points 0-255 and bytes
     return intermediate.encode("latin-1")
+
+
+def short_string(text: str, max_length: int) -> str:
+    """
+    Shorten a string to fit max_length by replacing its middle with "...".
+
+    Unlike short_path, this does no path handling, so it suits free-form
+    display text like event details.
+
+    Args:
+        text: The string to shorten
+        max_length: The maximum length of the result
+
+    Returns:
+        str: The original string if it fits, otherwise its start and end joined by "..."
+
+    Examples:
+        >>> short_string('hello world', 20)
+        'hello world'
+        >>> short_string('hello world', 8)
+        'he...rld'
+    """
+    if len(text) <= max_length:
+        return text
+    if max_length <= 3:
+        return "..."[: max(0, max_length)]
+
+    # keep slightly more of the end, it's usually the interesting part
+    keep = max_length - 3
+    start_len = keep // 2
+    end_len = keep - start_len
+    return f"{text[:start_len]}...{text[-end_len:]}"
@@ -0,0 +1,41 @@
+"""
+Tests for the detail screen header text.
+"""
+
+import pytest
+from rich.text import Text
+
+from lsoph.monitor import FileInfo
+from lsoph.ui.detail_screen import DetailScreen
+
+
+@pytest.mark.parametrize(
+    "path",
+    [
+        b"/tmp/normal/name.txt",
+        b"/tmp/we\rird\x07name",
+        b"/tmp/\x08\x0b\x0cctl",
+    ],
+)
+@pytest.mark.parametrize(
+    "status, style",
+    [
+        ("error", "bold red"),
+        ("deleted", "strike"),
+        ("accessed", ""),
+    ],
+)
+def test_header_matches_assemble(path, status, style):
+    """Header text and spans match Text.assemble, control characters included."""
+    screen = DetailScreen(FileInfo(path=path, status=status))
+    expected = Text.assemble(
+        "Details for: ",
+        (screen._path_short, "bold"),
+        " | Status: ",
+        (status.upper(), style),
+    )
+
+    header = screen._create_header_text()
+
+    assert header.plain == expected.plain
+    assert header.spans == expected.spans
@@ -0,0 +1,44 @@
+"""
+Tests for the detail screen's timestamp formatter.
+"""
+
+import datetime
+import random
+
+import pytest
+
+from lsoph.ui.detail_screen import _fmt_ts
+
+
+def _reference(ts: float) -> str:
+    return datetime.datetime.fromtimestamp(ts).strftime("%H:%M:%S.%f")[:-3]
+
+
+@pytest.mark.parametrize(
+    "ts",
+    [
+        1.0,
+        1700000000.0,
+        1700000000.5,
+        1700000000.123,
+        1700000000.0005,
+        1700000000.9995,
+        1700000000.9999996,
+        1413996846.3269994,
+        1995751684.8099995,
+    ],
+)
+def test_matches_datetime(ts):
+    """Known edge cases format the same as datetime.fromtimestamp."""
+    assert _fmt_ts(ts) == _reference(ts)
+
+
+def test_matches_datetime_random():
+    """A spread of random timestamps formats the same as datetime.fromtimestamp."""
+    rng = random.Random(1234)
+    for _ in range(20000):
+        ts = rng.uniform(1, 2e9)
+        assert _fmt_ts(ts) == _reference(ts), ts
+        # Fractions near a millisecond or second boundary
+        ts = float(int(ts)) + rng.choice([0.0005, 0.9995, 0.9999995, 0.9999996])
+        assert _fmt_ts(ts) == _reference(ts), ts
@@ -0,0 +1,17 @@
+"""
+Tests for the detail screen's event row formatter.
+"""
+
+from lsoph.ui.detail_screen import _format_event_row
+
+
+def test_event_type_upper_cased():
+    """String event types are shown upper-cased."""
+    _, etype_text, _, _ = _format_event_row({"ts": 1.7e9, "type": "open"})
+    assert etype_text.plain.endswith(" OPEN")
+
+
+def test_unhashable_event_type():
+    """Non-string event types are rendered via str() rather than raising."""
+    _, etype_text, _, _ = _format_event_row({"ts": 1.7e9, "type": ["x"]})
+    assert etype_text.plain.endswith(" ['X']")
@@ -0,0 +1,39 @@
+"""
+Tests for the short_string utility function.
+"""
+
+from lsoph.util.string import short_string
+
+
+def test_fits_unchanged():
+    """Strings within the limit are returned as-is."""
+    assert short_string("hello", 10) == "hello"
+    assert short_string("hello", 5) == "hello"
+    assert short_string("", 0) == ""
+
+
+def test_middle_truncated():
+    """Long strings keep their start and end around an ellipsis."""
+    assert short_string("hello world", 8) == "he...rld"
+    assert short_string("abcdefghij", 9) == "abc...hij"
+
+
+def test_exact_length():
+    """The result is never longer than max_length."""
+    text = "fd=3, flags='O_RDONLY', size=4096, mode=0o644"
+    for max_length in range(len(text) + 2):
+        assert len(short_string(text, max_length)) <= max_length
+
+
+def test_tiny_limits():
+    """Limits too small for any content fall back to (part of) the ellipsis."""
+    assert short_string("hello world", 4) == "...d"
+    assert short_string("hello world", 3) == "..."
+    assert short_string("hello world", 2) == ".."
+    assert short_string("hello world", 0) == ""
+    assert short_string("hello world", -1) == ""
+
+
+def test_non_ascii():
+    """Operates on code points, including surrogate-escaped bytes."""
+    assert short_string("\udcff" * 10, 5) == "\udcff...\udcff"